@@ -4,27 +4,222 @@ Handles authentication and data fetching from MLIT API
 """
 
 import os
+import sys
+import asyncio
+import aiohttp
+import gzip
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import orjson
 import time
-from typing import Dict, List, Optional
+from collections import deque
+from typing import Dict, Iterator, List, Optional, Tuple
 from dotenv import load_dotenv
 import pandas as pd
 
+from cache import ResponseCache
+
+# HTTP statuses worth retrying (throttling and transient server errors)
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+class RateLimiter:
+    def __init__(self, requests_per_minute: int = 600, cooldown: float = 1.0):
+        """
+        Sliding-window request limiter shared by all concurrent fetches
+        
+        Args:
+            requests_per_minute: Maximum requests started in any 60 second window
+            cooldown: Pause applied when the API reports no remaining quota
+                      without a Retry-After header
+        """
+        self.requests_per_minute = requests_per_minute
+        self.cooldown = cooldown
+        self.window = deque()
+        self.blocked_until = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait until a request slot is available in the current window"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self.window and now - self.window[0] >= 60:
+                    self.window.popleft()
+                
+                wait = self.blocked_until - now
+                if len(self.window) >= self.requests_per_minute:
+                    wait = max(wait, 60 - (now - self.window[0]))
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+            
+            self.window.append(time.monotonic())
+    
+    def update_from_headers(self, headers) -> Optional[float]:
+        """
+        Back off according to X-RateLimit-Remaining / Retry-After headers
+        
+        Args:
+            headers: Response headers
+            
+        Returns:
+            Seconds the limiter is now blocked for, or None if not blocked
+        """
+        delay = None
+        retry_after = headers.get('Retry-After')
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                pass
+        
+        remaining = headers.get('X-RateLimit-Remaining')
+        if delay is None and remaining is not None:
+            try:
+                if int(remaining) <= 0:
+                    delay = self.cooldown
+            except ValueError:
+                pass
+        
+        if delay is not None:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + delay)
+        return delay
+
+class ConcurrencyController:
+    def __init__(self, initial_limit: int = 16, min_limit: int = 2, max_limit: int = 128,
+                 target_latency: float = 2.0, window: int = 20, alpha: float = 0.5,
+                 beta: float = 0.5, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        AIMD concurrency limit with a circuit breaker
+        
+        The limit grows by alpha while the average latency over the last
+        `window` responses stays at or below target_latency, and is multiplied
+        by beta on latency spikes, throttling (429), 5xx or connection errors.
+        After failure_threshold consecutive failures the circuit opens and no
+        new requests start for reset_timeout seconds.
+        
+        Args:
+            initial_limit: Starting number of concurrent requests (c_t)
+            min_limit: Lower bound for the limit (C_min)
+            max_limit: Upper bound for the limit (C_max)
+            target_latency: Average latency (seconds) considered healthy
+            window: Number of recent latencies to average
+            alpha: Additive increase step
+            beta: Multiplicative decrease factor
+            failure_threshold: Consecutive failures before the circuit opens
+            reset_timeout: Seconds the circuit stays open
+        """
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.target_latency = target_latency
+        self.alpha = alpha
+        self.beta = beta
+        self.latencies = deque(maxlen=window)
+        self.in_flight = 0
+        self._condition = asyncio.Condition()
+        self._last_decrease = 0.0
+        
+        # Circuit breaker state
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+    
+    async def acquire(self):
+        """Wait for a free slot under the current limit and a closed circuit"""
+        while True:
+            wait = self.open_until - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            
+            async with self._condition:
+                await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+                if time.monotonic() >= self.open_until:
+                    self.in_flight += 1
+                    return
+    
+    async def release(self):
+        """Free a slot and wake up waiting requests"""
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+    
+    def _decrease(self):
+        # Cut at most once per target_latency so a burst of concurrent
+        # failures doesn't collapse the limit straight to min_limit
+        now = time.monotonic()
+        if now - self._last_decrease >= self.target_latency:
+            self.limit = max(self.min_limit, self.limit * self.beta)
+            self._last_decrease = now
+            self.latencies.clear()
+    
+    def observe(self, latency: float, status: Optional[int]):
+        """
+        Record a finished request and adjust the concurrency limit
+        
+        Args:
+            latency: Request duration in seconds
+            status: HTTP status, or None for timeouts/connection errors
+        """
+        if status is None or status in RETRYABLE_STATUSES:
+            self._decrease()
+            self.consecutive_failures += 1
+            if self.consecutive_failures >= self.failure_threshold:
+                self.open_until = time.monotonic() + self.reset_timeout
+                self.consecutive_failures = 0
+                self.limit = self.min_limit
+                print(f"  🛑 Circuit open: pausing requests for {self.reset_timeout:.0f}s")
+            return
+        
+        self.consecutive_failures = 0
+        self.latencies.append(latency)
+        if len(self.latencies) < self.latencies.maxlen:
+            return
+        
+        average_latency = sum(self.latencies) / len(self.latencies)
+        if average_latency <= self.target_latency:
+            self.limit = min(self.max_limit, self.limit + self.alpha)
+        else:
+            self._decrease()
+
 class MLITAPIClient:
-    def __init__(self):
-        """Initialize API client with authentication from .env file"""
+    def __init__(self, cache_path: Optional[str] = "api_data/mlit_cache.db"):
+        """
+        Initialize API client with authentication from .env file
+        
+        Args:
+            cache_path: SQLite response cache file, or None to disable caching
+        """
         load_dotenv()
         self.api_key = os.getenv('Ocp-Apim-Subscription-Key')
         if not self.api_key:
             raise ValueError("API key not found in .env file. Please set Ocp-Apim-Subscription-Key")
         
         self.base_url = "https://www.reinfolib.mlit.go.jp/ex-api/external/XIT001"
+        self.city_list_url = "https://www.reinfolib.mlit.go.jp/ex-api/external/XIT002"
         self.headers = {
             'Ocp-Apim-Subscription-Key': self.api_key,
             'Content-Type': 'application/json'
         }
         
+        # Shared session keeps TCP/TLS connections alive between sync requests
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 502, 503, 504],
+            raise_on_status=False
+        )
+        self.session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=64,
+                                                   max_retries=retry))
+        
+        # On-disk cache of quarter responses
+        self.cache = ResponseCache(cache_path) if cache_path else None
+        
         # Prefecture mapping
         self.prefecture_codes = {
             'tokyo': '13',
@@ -44,12 +239,40 @@ class MLITAPIClient:
             '27': '大阪府',
             '23': '愛知県'
         }
+        
+        # Prefecture codes to fetch one city at a time (opt-in, e.g. {'13'}).
+        # Each split multiplies that prefecture's requests by its city count,
+        # all under the same requests_per_minute limit.
+        self.city_split_prefectures = set()
+        self.city_codes = {}
+        
+        # Concurrency settings for bulk (async) fetches
+        self.initial_concurrency = 16
+        self.min_concurrency = 2
+        self.max_concurrency = 128
+        self.target_latency = 2.0
+        self.requests_per_minute = 600
+        self.max_retries = 5
+        self.backoff_factor = 0.5
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Close the pooled HTTP session and the response cache"""
+        self.session.close()
+        if self.cache:
+            self.cache.close()
     
     def test_connection(self) -> bool:
         """Test API connection with a simple request"""
         try:
             print("Testing API connection...")
-            response = self.fetch_quarter_data('13', '2024', '1')  # Tokyo, 2024 Q1
+            # Bypass the cache so the check always reaches the API
+            response = self.fetch_quarter_data('13', '2024', '1', use_cache=False)  # Tokyo, 2024 Q1
             if response and len(response) > 0:
                 print(f"✅ API connection successful. Retrieved {len(response)} records.")
                 return True
@@ -60,8 +283,39 @@ class MLITAPIClient:
             print(f"❌ API connection failed: {e}")
             return False
     
+    def fetch_city_codes(self, prefecture_code: str) -> List[str]:
+        """
+        Get the city codes of a prefecture from the municipality list endpoint
+        
+        Args:
+            prefecture_code: 2-digit prefecture code
+            
+        Returns:
+            List of 5-digit city codes (empty if the lookup failed)
+        """
+        if prefecture_code not in self.city_codes:
+            try:
+                response = self.session.get(
+                    self.city_list_url,
+                    params={'area': prefecture_code},
+                    timeout=30
+                )
+                response_data = orjson.loads(response.content) if response.status_code == 200 else {}
+            except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
+                print(f"  ❌ City list error for {prefecture_code}: {e}")
+                return []
+            
+            if response_data.get('status') != 'OK' or 'data' not in response_data:
+                print(f"  ⚠️ No city list for {prefecture_code}, fetching whole prefecture")
+                return []
+            
+            self.city_codes[prefecture_code] = [city['id'] for city in response_data['data']]
+            print(f"🏙️ Prefecture {prefecture_code}: {len(self.city_codes[prefecture_code])} cities")
+        
+        return self.city_codes[prefecture_code]
+    
     def fetch_quarter_data(self, prefecture_code: str, year: str, quarter: str, 
-                          city: Optional[str] = None) -> List[Dict]:
+                          city: Optional[str] = None, use_cache: bool = True) -> List[Dict]:
         """
         Fetch real estate data for a specific prefecture, year, and quarter
         
@@ -70,6 +324,7 @@ class MLITAPIClient:
             year: Year in YYYY format
             quarter: Quarter (1-4)
             city: Optional 5-digit city code
+            use_cache: If False, always query the API (the response is still stored)
             
         Returns:
             List of transaction records
@@ -83,21 +338,28 @@ class MLITAPIClient:
         
         if city:
             params['city'] = city
+        
+        if self.cache and use_cache:
+            cached = self.cache.get(prefecture_code, year, quarter, city)
+            if cached is not None:
+                print(f"Cached: Prefecture {prefecture_code}, {year}Q{quarter} ({len(cached)} records)")
+                return cached
             
         try:
             print(f"Fetching: Prefecture {prefecture_code}, {year}Q{quarter}")
-            response = requests.get(
+            response = self.session.get(
                 self.base_url, 
-                headers=self.headers, 
                 params=params,
                 timeout=30
             )
             
             if response.status_code == 200:
-                response_data = response.json()
+                response_data = orjson.loads(response.content)
                 if response_data.get('status') == 'OK' and 'data' in response_data:
                     data = response_data['data']
                     print(f"  ✅ Retrieved {len(data)} records")
+                    if self.cache and data:
+                        self.cache.set(prefecture_code, year, quarter, data, city)
                     return data
                 else:
                     print(f"  ⚠️ API returned status: {response_data.get('status', 'Unknown')}")
@@ -116,88 +378,249 @@ class MLITAPIClient:
             print(f"  ❌ JSON decode error: {e}")
             return []
     
+    async def fetch_quarter_data_async(self, session: aiohttp.ClientSession,
+                                       prefecture_code: str, year: str, quarter: str,
+                                       city: Optional[str] = None,
+                                       rate_limiter: Optional[RateLimiter] = None,
+                                       controller: Optional[ConcurrencyController] = None) -> List[Dict]:
+        """
+        Async version of fetch_quarter_data with retry on throttling/server errors
+        
+        Args:
+            session: Shared aiohttp session (reuses pooled connections)
+            prefecture_code: 2-digit prefecture code
+            year: Year in YYYY format
+            quarter: Quarter (1-4)
+            city: Optional 5-digit city code
+            rate_limiter: Optional limiter shared across concurrent requests
+            controller: Optional AIMD controller bounding concurrent requests
+            
+        Returns:
+            List of transaction records
+        """
+        params = {
+            'year': year,
+            'quarter': quarter,
+            'area': prefecture_code,
+            'priceClassification': '01'  # Transaction prices
+        }
+        
+        if city:
+            params['city'] = city
+        
+        if self.cache:
+            cached = self.cache.get(prefecture_code, year, quarter, city)
+            if cached is not None:
+                return cached
+        
+        label = f"{prefecture_code}{f'/{city}' if city else ''} {year}Q{quarter}"
+        for attempt in range(self.max_retries + 1):
+            if controller:
+                await controller.acquire()
+            if rate_limiter:
+                await rate_limiter.acquire()
+            
+            status = None
+            started = time.monotonic()
+            try:
+                async with session.get(self.base_url, params=params) as response:
+                    status = response.status
+                    delay = rate_limiter.update_from_headers(response.headers) if rate_limiter else None
+                    
+                    if response.status == 200:
+                        response_data = orjson.loads(await response.read())
+                        if response_data.get('status') == 'OK' and 'data' in response_data:
+                            data = response_data['data']
+                            if self.cache and data:
+                                self.cache.set(prefecture_code, year, quarter, data, city)
+                            return data
+                        print(f"  ⚠️ {label}: API returned status: {response_data.get('status', 'Unknown')}")
+                        return []
+                    
+                    if response.status not in RETRYABLE_STATUSES:
+                        print(f"  ❌ {label}: HTTP {response.status}: {await response.text()}")
+                        return []
+                    
+                    error = f"HTTP {response.status}"
+                    
+            except asyncio.TimeoutError:
+                error, delay = "timeout", None
+            except aiohttp.ClientError as e:
+                error, delay = f"request error: {e}", None
+            except json.JSONDecodeError as e:
+                print(f"  ❌ {label}: JSON decode error: {e}")
+                return []
+            finally:
+                if controller:
+                    controller.observe(time.monotonic() - started, status)
+                    await controller.release()
+            
+            if attempt == self.max_retries:
+                print(f"  ❌ {label}: giving up after {attempt + 1} attempts ({error})")
+                return []
+            
+            # Exponential backoff, unless the server told us how long to wait
+            backoff = delay if delay is not None else self.backoff_factor * (2 ** attempt)
+            print(f"  🔁 {label}: {error}, retrying in {backoff:.1f}s")
+            await asyncio.sleep(backoff)
+        
+        return []
+    
+    async def _fetch_quarters_async(self, tasks: List[Tuple[str, int, int, Optional[str]]]) -> List[List[Dict]]:
+        """
+        Fetch many (prefecture, year, quarter, city) combinations concurrently
+        
+        Args:
+            tasks: List of (prefecture_code, year, quarter, city) tuples; city
+                   is None for a whole-prefecture query
+            
+        Returns:
+            List of record lists, in the same order as tasks
+        """
+        controller = ConcurrencyController(
+            initial_limit=self.initial_concurrency,
+            min_limit=self.min_concurrency,
+            max_limit=self.max_concurrency,
+            target_latency=self.target_latency
+        )
+        rate_limiter = RateLimiter(self.requests_per_minute)
+        completed = 0
+        
+        connector = aiohttp.TCPConnector(limit_per_host=self.max_concurrency)
+        timeout = aiohttp.ClientTimeout(total=30)
+        
+        async with aiohttp.ClientSession(headers=self.headers, connector=connector,
+                                         timeout=timeout) as session:
+            async def fetch_one(prefecture_code: str, year: int, quarter: int,
+                                city: Optional[str]) -> List[Dict]:
+                nonlocal completed
+                label = f"{prefecture_code}{f'/{city}' if city else ''}"
+                try:
+                    data = await self.fetch_quarter_data_async(
+                        session, prefecture_code, str(year), str(quarter), city,
+                        rate_limiter=rate_limiter, controller=controller
+                    )
+                except Exception as e:
+                    # One bad quarter must not sink the rest of the fetch
+                    print(f"  ❌ {label} {year}Q{quarter}: {e}")
+                    data = []
+                
+                completed += 1
+                progress = (completed / len(tasks)) * 100
+                print(f"  {label} {year}Q{quarter}: {len(data)} records "
+                      f"- Progress: {progress:.1f}% ({completed}/{len(tasks)})")
+                
+                # Progress lines are buffered; push them out in batches
+                if completed % 100 == 0 or completed == len(tasks):
+                    sys.stdout.flush()
+                return data
+            
+            return await asyncio.gather(*(fetch_one(*task) for task in tasks))
+    
+    def _fetch_prefectures(self, prefecture_codes: List[str], start_year: int,
+                           end_year: int) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch all quarters for several prefectures in a single event loop
+        
+        Args:
+            prefecture_codes: List of 2-digit prefecture codes
+            start_year: Starting year
+            end_year: Ending year (inclusive)
+            
+        Returns:
+            Dictionary with prefecture codes as keys and record DataFrames as values
+        """
+        # Split large prefectures into per-city queries (None = whole prefecture)
+        cities = {
+            prefecture_code: (self.fetch_city_codes(prefecture_code)
+                              if prefecture_code in self.city_split_prefectures else []) or [None]
+            for prefecture_code in prefecture_codes
+        }
+        
+        tasks = [
+            (prefecture_code, year, quarter, city)
+            for prefecture_code in prefecture_codes
+            for year in range(start_year, end_year + 1)
+            for quarter in range(1, 5)
+            for city in cities[prefecture_code]
+        ]
+        results = asyncio.run(self._fetch_quarters_async(tasks))
+        
+        quarter_frames = {prefecture_code: [] for prefecture_code in prefecture_codes}
+        for (prefecture_code, year, quarter, city), quarter_data in zip(tasks, results):
+            if not quarter_data:
+                continue
+            
+            # Add metadata as whole columns rather than per record
+            quarter_frames[prefecture_code].append(pd.DataFrame(quarter_data).assign(
+                prefecture_code=prefecture_code,
+                prefecture_name=self.prefecture_names.get(prefecture_code, prefecture_code),
+                fetch_year=year,
+                fetch_quarter=quarter
+            ))
+        
+        return {
+            prefecture_code: pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+            for prefecture_code, frames in quarter_frames.items()
+        }
+    
     def fetch_prefecture_data(self, prefecture_code: str, start_year: int, 
-                             end_year: int, delay: float = 0.1) -> List[Dict]:
+                             end_year: int) -> pd.DataFrame:
         """
         Fetch all data for a prefecture across multiple years and quarters
         
+        Quarters are requested concurrently (bounded by an AIMD concurrency
+        limit and requests_per_minute).
+        
         Args:
             prefecture_code: 2-digit prefecture code
             start_year: Starting year
             end_year: Ending year (inclusive)
-            delay: Delay between requests to be respectful to API
             
         Returns:
-            Combined list of all transaction records
+            DataFrame of all transaction records (one column per API field,
+            plus prefecture_code, prefecture_name, fetch_year, fetch_quarter)
         """
-        all_data = []
         total_quarters = (end_year - start_year + 1) * 4
-        current_quarter = 0
         
         prefecture_name = self.prefecture_names.get(prefecture_code, prefecture_code)
         print(f"\n📊 Fetching data for {prefecture_name} ({start_year}-{end_year})")
         print(f"Expected quarters: {total_quarters}")
         
-        for year in range(start_year, end_year + 1):
-            for quarter in range(1, 5):
-                current_quarter += 1
-                progress = (current_quarter / total_quarters) * 100
-                
-                quarter_data = self.fetch_quarter_data(
-                    prefecture_code, str(year), str(quarter)
-                )
-                
-                if quarter_data:
-                    # Add metadata to each record
-                    for record in quarter_data:
-                        record['prefecture_code'] = prefecture_code
-                        record['prefecture_name'] = prefecture_name
-                        record['fetch_year'] = year
-                        record['fetch_quarter'] = quarter
-                    
-                    all_data.extend(quarter_data)
-                
-                print(f"  Progress: {progress:.1f}% ({current_quarter}/{total_quarters})")
-                
-                # Be respectful to the API
-                if delay > 0:
-                    time.sleep(delay)
+        all_data = self._fetch_prefectures([prefecture_code], start_year, end_year)[prefecture_code]
         
         print(f"✅ {prefecture_name} complete: {len(all_data)} total records")
         return all_data
     
-    def fetch_all_prefectures(self, start_year: int = 2007, end_year: int = 2024) -> Dict[str, List[Dict]]:
+    def fetch_all_prefectures(self, start_year: int = 2007, end_year: int = 2024) -> Dict[str, pd.DataFrame]:
         """
         Fetch data for all 6 prefectures
         
+        All (prefecture, year, quarter) requests share one concurrent fetch.
+        
         Args:
             start_year: Starting year (default: 2007)
             end_year: Ending year (default: 2024)
             
         Returns:
-            Dictionary with prefecture names as keys and data lists as values
+            Dictionary with prefecture names as keys and record DataFrames as values
         """
-        all_prefecture_data = {}
         total_prefectures = len(self.prefecture_codes)
         
         print(f"\n🚀 Starting full data fetch for {total_prefectures} prefectures")
         print(f"Time range: {start_year}-{end_year}")
-        print(f"Estimated API calls: {total_prefectures * (end_year - start_year + 1) * 4}")
+        print(f"Estimated API calls: {total_prefectures * (end_year - start_year + 1) * 4} "
+              f"(plus per-city calls for split prefectures)")
+        print(f"Concurrent requests: {self.initial_concurrency} (adaptive, "
+              f"{self.min_concurrency}-{self.max_concurrency})")
         
-        for i, (prefecture_name, prefecture_code) in enumerate(self.prefecture_codes.items(), 1):
-            print(f"\n{'='*60}")
-            print(f"Prefecture {i}/{total_prefectures}: {prefecture_name.upper()}")
-            print(f"{'='*60}")
-            
-            try:
-                prefecture_data = self.fetch_prefecture_data(
-                    prefecture_code, start_year, end_year
-                )
-                all_prefecture_data[prefecture_name] = prefecture_data
-                
-            except Exception as e:
-                print(f"❌ Failed to fetch data for {prefecture_name}: {e}")
-                all_prefecture_data[prefecture_name] = []
+        data_by_code = self._fetch_prefectures(
+            list(self.prefecture_codes.values()), start_year, end_year
+        )
+        all_prefecture_data = {
+            prefecture_name: data_by_code[prefecture_code]
+            for prefecture_name, prefecture_code in self.prefecture_codes.items()
+        }
         
         # Summary
         total_records = sum(len(data) for data in all_prefecture_data.values())
@@ -209,31 +632,50 @@ class MLITAPIClient:
         
         return all_prefecture_data
     
-    def save_raw_data(self, data: Dict[str, List[Dict]], output_dir: str = "api_data"):
+    def save_raw_data(self, data: Dict[str, pd.DataFrame], output_dir: str = "api_data"):
         """
-        Save raw API data to JSON files for backup and analysis
+        Save raw API data to gzip-compressed JSON Lines files for backup and analysis
+        
+        Records are written one per line, so files can be streamed back with
+        iter_raw_data without loading everything into memory.
         
         Args:
             data: Prefecture data dictionary
-            output_dir: Output directory for JSON files
+            output_dir: Output directory for .jsonl.gz files
         """
         os.makedirs(output_dir, exist_ok=True)
         
         for prefecture, records in data.items():
-            if records:
-                filename = f"{output_dir}/{prefecture}_api_raw.json"
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(records, f, ensure_ascii=False, indent=2)
+            if len(records):
+                filename = f"{output_dir}/{prefecture}_api_raw.jsonl.gz"
+                records.to_json(filename, orient='records', lines=True, force_ascii=False,
+                                compression='gzip')
                 print(f"💾 Saved {len(records)} records to {filename}")
             else:
                 print(f"⚠️ No data to save for {prefecture}")
+    
+    def iter_raw_data(self, prefecture: str, input_dir: str = "api_data") -> Iterator[Dict]:
+        """
+        Stream raw API records saved by save_raw_data
+        
+        Args:
+            prefecture: Prefecture name (english)
+            input_dir: Directory containing .jsonl.gz files
+            
+        Yields:
+            One transaction record at a time
+        """
+        filename = f"{input_dir}/{prefecture}_api_raw.jsonl.gz"
+        with gzip.open(filename, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield orjson.loads(line)
 
 if __name__ == "__main__":
     # Test the API client
-    client = MLITAPIClient()
-    
-    # Test connection
-    if client.test_connection():
-        print("API client is ready to use!")
-    else:
-        print("API client setup failed.")
\ No newline at end of file
+    with MLITAPIClient() as client:
+        # Test connection
+        if client.test_connection():
+            print("API client is ready to use!")
+        else:
+            print("API client setup failed.")
\ No newline at end of file
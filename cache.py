@@ -0,0 +1,137 @@
+"""
+SQLite Response Cache for MLIT API
+Stores quarter responses on disk so incremental updates only hit the API
+for recent quarters
+"""
+
+import os
+import orjson
+import sqlite3
+import time
+import zlib
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+class ResponseCache:
+    def __init__(self, path: str = "api_data/mlit_cache.db", recent_ttl: int = 24 * 60 * 60,
+                 settle_days: int = 180):
+        """
+        Configure the response cache (the database is opened on first use)
+        
+        Args:
+            path: SQLite database file
+            recent_ttl: Seconds a recent quarter's response stays valid
+            settle_days: Days after a quarter ends before it is treated as
+                         closed and cached indefinitely
+        """
+        self.path = path
+        self.recent_ttl = recent_ttl
+        self.settle_days = settle_days
+        self._conn = None
+    
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Database connection, opened (and the file created) on first access"""
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            
+            self._conn = sqlite3.connect(self.path)
+            self._create_schema()
+        return self._conn
+    
+    def _create_schema(self):
+        """Apply connection pragmas and create the responses table"""
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(f"PRAGMA mmap_size={64 * 1024 * 1024}")
+        self._conn.execute("PRAGMA cache_size=-65536")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                pref TEXT NOT NULL,
+                year INTEGER NOT NULL,
+                quarter INTEGER NOT NULL,
+                city TEXT NOT NULL DEFAULT '',
+                fetched_at INTEGER NOT NULL,
+                body BLOB NOT NULL,
+                PRIMARY KEY (pref, year, quarter, city)
+            )
+        """)
+        self._conn.commit()
+    
+    def settled_at(self, year: int, quarter: int) -> datetime:
+        """
+        Get the time after which a quarter's data is treated as final
+        
+        Args:
+            year: Year
+            quarter: Quarter (1-4)
+        
+        Returns:
+            Quarter end plus settle_days
+        """
+        if quarter == 4:
+            quarter_end = datetime(year + 1, 1, 1)
+        else:
+            quarter_end = datetime(year, quarter * 3 + 1, 1)
+        return quarter_end + timedelta(days=self.settle_days)
+    
+    def get(self, prefecture_code: str, year: int, quarter: int,
+            city: Optional[str] = None) -> Optional[List[Dict]]:
+        """
+        Look up a cached quarter response
+        
+        Args:
+            prefecture_code: 2-digit prefecture code
+            year: Year
+            quarter: Quarter (1-4)
+            city: Optional 5-digit city code
+        
+        Returns:
+            Cached list of records, or None if missing or stale
+        """
+        year, quarter = int(year), int(quarter)
+        row = self.conn.execute(
+            "SELECT fetched_at, body FROM responses WHERE pref=? AND year=? AND quarter=? AND city=?",
+            (prefecture_code, year, quarter, city or '')
+        ).fetchone()
+        
+        if row is None:
+            return None
+        
+        fetched_at, body = row
+        
+        # Only a copy fetched after the quarter settled is final; anything
+        # fetched earlier may predate MLIT revisions and follows recent_ttl
+        is_final = fetched_at >= self.settled_at(year, quarter).timestamp()
+        if not is_final and time.time() - fetched_at > self.recent_ttl:
+            return None
+        
+        return orjson.loads(zlib.decompress(body))
+    
+    def set(self, prefecture_code: str, year: int, quarter: int, data: List[Dict],
+            city: Optional[str] = None):
+        """
+        Store a quarter response
+        
+        Args:
+            prefecture_code: 2-digit prefecture code
+            year: Year
+            quarter: Quarter (1-4)
+            data: List of records returned by the API
+            city: Optional 5-digit city code
+        """
+        body = zlib.compress(orjson.dumps(data))
+        self.conn.execute(
+            "INSERT OR REPLACE INTO responses (pref, year, quarter, city, fetched_at, body) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (prefecture_code, int(year), int(quarter), city or '', int(time.time()), body)
+        )
+        self.conn.commit()
+    
+    def close(self):
+        """Close the database connection (if it was ever opened)"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
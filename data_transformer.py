@@ -5,7 +5,7 @@ Maps API JSON response to match current CSV structure for chart generation
 
 import pandas as pd
 import re
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
 from datetime import datetime
 
 class APIDataTransformer:
@@ -32,6 +32,16 @@ class APIDataTransformer:
             '５ＬＤＫ以上': '４ＬＤＫ',  # Map 5LDK+ to 4LDK for simplification
         }
         
+        # Pattern-based fallback for plans missing from the mapping (checked in order)
+        self.room_type_patterns = [
+            ('１Ｒ', ('１Ｒ', '1R')),
+            ('１Ｋ', ('１Ｋ', '1K')),
+            ('１ＬＤＫ', ('１ＬＤＫ', '1LDK')),
+            ('２ＬＤＫ', ('２ＬＤＫ', '2LDK')),
+            ('３ＬＤＫ', ('３ＬＤＫ', '3LDK')),
+            ('４ＬＤＫ', ('４ＬＤＫ', '4LDK')),
+        ]
+        
         # Prefecture name standardization
         self.prefecture_name_mapping = {
             '東京都': '東京都',
@@ -42,6 +52,18 @@ class APIDataTransformer:
             '愛知県': '愛知県'
         }
         
+        # Fixed category set for standardized room types
+        self.room_type_categories = ['１Ｒ', '１Ｋ', '１ＬＤＫ', '２ＬＤＫ', '３ＬＤＫ', '４ＬＤＫ', 'その他']
+        
+        # Building age buckets (label -> upper bound in years)
+        self.age_buckets = {'15年以内': 15, '16年以上': float('inf')}
+        
+        # Precompiled patterns for cleaning API fields
+        self._year_re = re.compile(r'(\d{4})年')
+        self._building_year_re = re.compile(r'^(\d{4})年$')
+        self._price_re = re.compile(r'[^\d]')
+        self._area_re = re.compile(r'[^\d.]')
+        
         # Property type filter (focus on residential condominiums)
         self.valid_property_types = [
             '中古マンション等',
@@ -49,6 +71,15 @@ class APIDataTransformer:
             '土地',
             '建物'
         ]
+        
+        # Low-cardinality columns stored as pandas categoricals
+        self.categorical_dtypes = {
+            '種類': pd.CategoricalDtype(self.valid_property_types),
+            '間取り': pd.CategoricalDtype(self.room_type_categories),
+            '都道府県名': 'category',
+            '市区町村名': 'category',
+            'age_bucket': pd.CategoricalDtype(list(self.age_buckets))
+        }
     
     def extract_year_from_period(self, period: str) -> Optional[int]:
         """
@@ -61,7 +92,7 @@ class APIDataTransformer:
             Year as integer or None if parsing fails
         """
         try:
-            match = re.search(r'(\d{4})年', period)
+            match = self._year_re.search(period)
             if match:
                 return int(match.group(1))
         except:
@@ -109,20 +140,10 @@ class APIDataTransformer:
             return self.room_type_mapping[clean_plan]
         
         # Pattern-based matching for edge cases
-        if '１Ｒ' in clean_plan or '1R' in clean_plan:
-            return '１Ｒ'
-        elif '１Ｋ' in clean_plan or '1K' in clean_plan:
-            return '１Ｋ'
-        elif '１ＬＤＫ' in clean_plan or '1LDK' in clean_plan:
-            return '１ＬＤＫ'
-        elif '２ＬＤＫ' in clean_plan or '2LDK' in clean_plan:
-            return '２ＬＤＫ'
-        elif '３ＬＤＫ' in clean_plan or '3LDK' in clean_plan:
-            return '３ＬＤＫ'
-        elif '４ＬＤＫ' in clean_plan or '4LDK' in clean_plan:
-            return '４ＬＤＫ'
-        else:
-            return 'その他'
+        for room_type, patterns in self.room_type_patterns:
+            if any(pattern in clean_plan for pattern in patterns):
+                return room_type
+        return 'その他'
     
     def clean_price(self, trade_price: str) -> Optional[int]:
         """
@@ -137,7 +158,7 @@ class APIDataTransformer:
         try:
             if trade_price:
                 # Remove any non-digit characters and convert
-                clean_price = re.sub(r'[^\d]', '', str(trade_price))
+                clean_price = self._price_re.sub('', str(trade_price))
                 return int(clean_price) if clean_price else None
         except:
             pass
@@ -156,7 +177,7 @@ class APIDataTransformer:
         try:
             if area:
                 # Remove any non-numeric characters except decimal point
-                clean_area = re.sub(r'[^\d.]', '', str(area))
+                clean_area = self._area_re.sub('', str(area))
                 return float(clean_area) if clean_area else None
         except:
             pass
@@ -197,37 +218,101 @@ class APIDataTransformer:
         
         return transformed
     
-    def transform_api_data(self, api_data: List[Dict]) -> pd.DataFrame:
+    def standardize_room_types(self, floor_plans: pd.Series) -> pd.Series:
+        """
+        Vectorized standardize_room_type for a whole column
+        
+        Args:
+            floor_plans: FloorPlan column from API
+            
+        Returns:
+            Series of standardized room types
+        """
+        clean_plans = floor_plans.fillna('').astype(str).str.strip()
+        room_types = clean_plans.map(self.room_type_mapping)
+        
+        # Pattern-based matching for plans the mapping didn't cover
+        for room_type, patterns in self.room_type_patterns:
+            unmatched = room_types.isna()
+            if not unmatched.any():
+                break
+            found = pd.Series(False, index=clean_plans.index)
+            for pattern in patterns:
+                found |= clean_plans.str.contains(pattern, regex=False)
+            room_types = room_types.mask(unmatched & found, room_type)
+        
+        return room_types.fillna('その他')
+    
+    def transform_api_data(self, api_data: Union[List[Dict], pd.DataFrame]) -> pd.DataFrame:
         """
         Transform list of API records to pandas DataFrame matching CSV structure
         
+        Columns are transformed with vectorized pandas operations; the result
+        matches applying transform_api_record to every record.
+        
         Args:
-            api_data: List of records from API
+            api_data: Records from API, as a list or a DataFrame
             
         Returns:
             DataFrame with CSV-compatible structure
         """
-        if not api_data:
+        if len(api_data) == 0:
             return pd.DataFrame()
         
         print(f"Transforming {len(api_data)} API records...")
         
-        # Transform each record
-        transformed_records = []
-        for record in api_data:
-            # Filter for residential properties only
-            if record.get('Type') in self.valid_property_types:
-                transformed = self.transform_api_record(record)
-                # Only include records with valid price and year
-                if transformed['取引価格（総額）'] and transformed['取引時期（年）']:
-                    transformed_records.append(transformed)
-        
-        if not transformed_records:
+        api_fields = ['Type', 'Prefecture', 'Municipality', 'DistrictName', 'TradePrice',
+                      'FloorPlan', 'Area', 'BuildingYear', 'Period']
+        raw = pd.DataFrame(api_data).reindex(columns=api_fields)
+        
+        # Filter for residential properties only
+        raw = raw[raw['Type'].isin(set(self.valid_property_types))]
+        
+        # Extract transaction year and clean price
+        transaction_year = raw['Period'].astype('string').str.extract(self._year_re, expand=False).astype('Int16')
+        price = pd.to_numeric(
+            raw['TradePrice'].astype('string').str.replace(self._price_re, '', regex=True),
+            errors='coerce'
+        ).astype('Int64')
+        
+        # Only include records with valid price and year
+        valid = transaction_year.notna() & price.notna() & (price != 0)
+        raw = raw[valid]
+        
+        # No missing values remain, so store plain (non-nullable) NumPy columns
+        transaction_year = transaction_year[valid].astype('int16')
+        price = price[valid].astype('int64')
+        
+        if raw.empty:
             print("⚠️ No valid records after transformation")
             return pd.DataFrame()
         
-        # Create DataFrame
-        df = pd.DataFrame(transformed_records)
+        area = pd.to_numeric(
+            raw['Area'].astype('string').str.replace(self._area_re, '', regex=True),
+            errors='coerce'
+        ).astype('float64')
+        built_year = raw['BuildingYear'].astype('string').str.extract(
+            self._building_year_re, expand=False
+        ).astype('Int16')
+        building_age = (transaction_year - built_year).clip(lower=0)  # Age cannot be negative
+        
+        df = pd.DataFrame({
+            '種類': raw['Type'],
+            '都道府県名': raw['Prefecture'].fillna(''),
+            '市区町村名': raw['Municipality'].fillna(''),
+            '地区名': raw['DistrictName'].fillna(''),
+            '最寄駅：名称': '',  # Not available in API
+            '最寄駅：距離（分）': '',  # Not available in API
+            '取引価格（総額）': price,
+            '間取り': self.standardize_room_types(raw['FloorPlan']),
+            '面積（㎡）': area,
+            '建築年': raw['BuildingYear'].fillna(''),
+            '取引時期': raw['Period'].fillna(''),
+            '取引時期（年）': transaction_year,
+            '築年数': building_age,
+            'age_bucket': pd.cut(building_age, bins=[-1, *self.age_buckets.values()],
+                                 labels=list(self.age_buckets))
+        }).reset_index(drop=True).astype(self.categorical_dtypes)
         
         # Data quality report
         print(f"✅ Transformation complete:")
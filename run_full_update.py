@@ -4,8 +4,25 @@ Run this script to update all house-trend data and regenerate all charts
 """
 
 from update_pipeline import HouseTrendUpdater
+import io
 import sys
 
+def use_buffered_stdout(buffer_size: int = 1024 * 1024):
+    """
+    Replace stdout with a block-buffered writer
+    
+    The pipeline prints hundreds of progress lines per prefecture; with a
+    large buffer they reach the terminal/log in batches (flushed by the
+    pipeline per prefecture and per fetch batch) instead of one write each.
+    
+    Args:
+        buffer_size: Output buffer size in bytes
+    """
+    sys.stdout.flush()
+    raw = io.FileIO(sys.stdout.fileno(), 'w', closefd=False)
+    sys.stdout = io.TextIOWrapper(io.BufferedWriter(raw, buffer_size=buffer_size),
+                                  encoding='utf-8', line_buffering=False)
+
 def main():
     """Run the complete production update"""
     
@@ -25,6 +42,8 @@ def main():
         print("❌ Update cancelled by user")
         return
     
+    use_buffered_stdout()
+    
     try:
         # Initialize updater
         updater = HouseTrendUpdater()
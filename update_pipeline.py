@@ -4,34 +4,398 @@ Complete pipeline to fetch data from MLIT API and generate updated charts
 """
 
 import os
+import sys
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+import matplotlib
+matplotlib.use('Agg')  # Headless rendering, charts are only saved to files
 import matplotlib.pyplot as plt
+plt.rcParams.update({
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000
+})
 import japanize_matplotlib
-from matplotlib.ticker import MaxNLocator, FuncFormatter
+from matplotlib.ticker import MaxNLocator, StrMethodFormatter
 from datetime import datetime
-import json
+from typing import List, Tuple
+import orjson
 
 from api_client import MLITAPIClient
 from data_transformer import APIDataTransformer
 
+# Chart figure, axes and data artists, created once per process and reused for every chart
+_chart_canvas = None
+
+def init_chart_canvas():
+    """
+    Create the chart figure, axes and artists for this process
+    
+    Used as the chart worker pool initializer, so figure creation, font
+    setup and the static axis styling happen once per worker before its
+    first task.
+    """
+    global _chart_canvas
+    if _chart_canvas is None:
+        fig, ax1 = plt.subplots(figsize=(12, 8))
+        
+        # Fixed margins sized for the axis labels and title, so savefig
+        # needs no bbox_inches='tight' layout pass
+        fig.subplots_adjust(left=0.12, right=0.93, top=0.92, bottom=0.08)
+        ax2 = ax1.twinx()
+        
+        # Price line; its data is replaced for every chart
+        price_line, = ax1.plot([], [], color='red', linewidth=2, marker='o')
+        ax1.set_xlabel('Year')
+        ax1.tick_params(axis='y', labelcolor='darkred')
+        ax1.xaxis.set_major_locator(MaxNLocator(integer=True))
+        
+        # Format y-axis to show full numbers (no scientific notation)
+        ax1.yaxis.set_major_formatter(StrMethodFormatter('{x:,.0f}'))
+        
+        ax2.tick_params(axis='y', labelcolor='darkblue')
+        ax2.grid(True, alpha=0.3)
+        
+        # Pool of count bars, grown on demand (one bar per year shown)
+        _chart_canvas = (fig, ax1, ax2, price_line, [])
+
+def _draw_chart(yearly_avg_price: pd.Series, yearly_count: pd.Series):
+    """
+    Draw the language-independent parts of a chart on the shared figure
+    
+    The cached line and bars are updated in place instead of being
+    re-created, and only the x-axis is rescaled to the new data.
+    
+    Args:
+        yearly_avg_price: Average price indexed by year
+        yearly_count: Transaction count indexed by year
+        
+    Returns:
+        Tuple of (figure, price axis, count axis, price line, count bar legend handle)
+    """
+    init_chart_canvas()
+    fig, ax1, ax2, price_line, count_bars = _chart_canvas
+    
+    price_line.set_data(yearly_avg_price.index, yearly_avg_price.values)
+    
+    # Grow the bar pool if this chart covers more years than any before
+    missing = len(yearly_count) - len(count_bars)
+    if missing > 0:
+        count_bars.extend(ax2.bar(np.zeros(missing), np.zeros(missing),
+                                  color='lightblue', width=0.4, alpha=0.5))
+    
+    # Move the first bars onto this chart's years and hide the rest
+    for bar, year, count in zip(count_bars, yearly_count.index, yearly_count.values):
+        bar.set_x(year - bar.get_width() / 2)
+        bar.set_height(count)
+        bar.set_visible(True)
+    for bar in count_bars[len(yearly_count):]:
+        bar.set_visible(False)
+    
+    # Rescale the shared x-axis to the visible data
+    ax1.relim(visible_only=True)
+    ax2.relim(visible_only=True)
+    ax1.autoscale_view(scaley=False)
+    
+    # Set y-axis limits dynamically based on actual data
+    price_max = max(yearly_avg_price.values) * 1.1  # Add 10% padding
+    count_max = max(yearly_count.values) * 1.2      # Add 20% padding
+    
+    ax1.set_ylim(0, price_max)
+    ax2.set_ylim(0, count_max)
+    
+    return fig, ax1, ax2, price_line, count_bars[0]
+
+def _set_chart_labels(ax1, ax2, price_line, count_bar, area: str, room_type: str,
+                      language: str = 'jp'):
+    """
+    Set (or replace) the language-specific labels, title and legend of a chart
+    
+    Args:
+        ax1: Price axis
+        ax2: Transaction count axis
+        price_line: Price line artist
+        count_bar: Transaction count bar (legend handle)
+        area: Area name
+        room_type: Room type
+        language: 'jp' or 'en'
+    """
+    if language == 'jp':
+        price_label, count_label = '平均取引価格', '取引回数'
+        ax1.set_ylabel('平均取引価格', color='darkred')
+        ax2.set_ylabel('取引回数', color='darkblue')
+        title = f'{area} - {room_type}の平均取引価格と取引件数の推移'
+    else:
+        price_label, count_label = 'Average Price', 'Transaction Count'
+        ax1.set_ylabel('Average Transaction Price', color='darkred')
+        ax2.set_ylabel('Number of transactions', color='darkblue')
+        title = f'{area} - The trend of the average transaction price and the number of transactions for {room_type}'
+    
+    ax2.set_title(title, fontsize=14, pad=20)
+    
+    # Legend (replaces the previous language's legend)
+    ax2.legend([price_line, count_bar], [price_label, count_label], loc='upper left')
+
+def render_charts(filepaths: dict, area: str, room_type: str, yearly_avg_price: pd.Series,
+                  yearly_count: pd.Series):
+    """
+    Draw one price/transaction-count chart and save it in several languages
+    
+    The lines, bars and axes are drawn once; only the labels are swapped
+    between saves.
+    
+    Args:
+        filepaths: Dictionary of language ('jp'/'en') to output PNG path
+        area: Area name
+        room_type: Room type
+        yearly_avg_price: Average price indexed by year
+        yearly_count: Transaction count indexed by year
+    """
+    fig, ax1, ax2, price_line, count_bar = _draw_chart(yearly_avg_price, yearly_count)
+    
+    for language, filepath in filepaths.items():
+        _set_chart_labels(ax1, ax2, price_line, count_bar, area, room_type, language)
+        fig.savefig(filepath, dpi=100)  # Web display size (1200x800), under half the pixels of dpi=150
+
+def render_chart(filepath: str, area: str, room_type: str, yearly_avg_price: pd.Series,
+                 yearly_count: pd.Series, language: str = 'jp'):
+    """
+    Draw and save one price/transaction-count chart
+    
+    Args:
+        filepath: Output PNG path
+        area: Area name
+        room_type: Room type
+        yearly_avg_price: Average price indexed by year
+        yearly_count: Transaction count indexed by year
+        language: 'jp' or 'en'
+    """
+    render_charts({language: filepath}, area, room_type, yearly_avg_price, yearly_count)
+
+def _yearly_totals(area_codes: np.ndarray, room_codes: np.ndarray, year_offsets: np.ndarray,
+                   prices: np.ndarray, shape: tuple):
+    """
+    Sum prices and count transactions per (area, room type, year) cell
+    
+    Args:
+        area_codes: Area category code of each row
+        room_codes: Room type category code of each row
+        year_offsets: Year of each row minus the first year
+        prices: Transaction price of each row
+        shape: (number of areas, number of room types, number of years)
+        
+    Returns:
+        Tuple of (price sums, transaction counts), both arrays of the given shape
+    """
+    cells = np.ravel_multi_index((area_codes, room_codes, year_offsets), shape)
+    size = int(np.prod(shape))
+    sums = np.bincount(cells, weights=prices, minlength=size).reshape(shape)
+    counts = np.bincount(cells, minlength=size).reshape(shape)
+    return sums, counts
+
+def compute_chart_series(df: pd.DataFrame, room_types: list) -> dict:
+    """
+    Compute yearly average price and transaction count for every chart
+    
+    Bins every row into an (area, room type, year) grid with np.bincount in
+    one pass, instead of filtering the DataFrame for each area and room type;
+    the "ALL" series are summed over the room type axis of the same grid.
+    
+    Args:
+        df: DataFrame with transaction data
+        room_types: Room types to chart ("ALL" for every row)
+        
+    Returns:
+        Nested dictionary {area: {room_type: DataFrame}} where each DataFrame
+        is indexed by year with 'mean' and 'count' columns. Combinations
+        without data are omitted.
+    """
+    areas = df['市区町村名'].astype('category').array
+    rooms = df['間取り'].astype('category').array
+    years = df['取引時期（年）']
+    prices = df['取引価格（総額）']
+    
+    # Rows without an area, year or price never appear in a chart
+    valid = (areas.codes >= 0) & years.notna().to_numpy() & prices.notna().to_numpy()
+    if not valid.any():
+        return {}
+    
+    years = years[valid].to_numpy(dtype=np.int64)
+    year_min = years.min()
+    year_index = np.arange(year_min, years.max() + 1)
+    
+    # Rows without a room type only count towards "ALL" (extra last slot)
+    room_codes = rooms.codes[valid].astype(np.int64)
+    room_codes[room_codes < 0] = len(rooms.categories)
+    
+    sums, counts = _yearly_totals(
+        areas.codes[valid].astype(np.int64), room_codes, years - year_min,
+        prices[valid].to_numpy(dtype=np.float64),
+        (len(areas.categories), len(rooms.categories) + 1, len(year_index))
+    )
+    
+    def yearly_stats(price_sums: np.ndarray, yearly_counts: np.ndarray) -> pd.DataFrame:
+        has_data = yearly_counts > 0
+        return pd.DataFrame({
+            'mean': price_sums[has_data] / yearly_counts[has_data],
+            'count': yearly_counts[has_data]
+        }, index=year_index[has_data])
+    
+    room_slots = {room_type: rooms.categories.get_loc(room_type)
+                  for room_type in room_types if room_type in rooms.categories}
+    
+    chart_series = {}
+    for area_code, area in enumerate(areas.categories):
+        area_counts = counts[area_code]
+        if not area_counts.any():
+            continue
+        
+        area_series = {}
+        if "ALL" in room_types:
+            area_series["ALL"] = yearly_stats(sums[area_code].sum(axis=0), area_counts.sum(axis=0))
+        
+        for room_type, slot in room_slots.items():
+            if area_counts[slot].any():
+                area_series[room_type] = yearly_stats(sums[area_code, slot], area_counts[slot])
+        
+        chart_series[area] = area_series
+    
+    return chart_series
+
+def render_area_charts(prefecture: str, area: str, area_series: dict, room_types: list,
+                       output_dir: str, skip_existing: bool = False):
+    """
+    Render the jp and en charts of every room type for one area
+    
+    Runs in chart worker processes, so it only receives the area's
+    precomputed yearly statistics rather than the prefecture DataFrame.
+    
+    Args:
+        prefecture: Prefecture name (english)
+        area: Area name
+        area_series: {room_type: yearly stats} from compute_chart_series
+        room_types: Room types to chart
+        output_dir: Chart output directory
+        skip_existing: If True, don't re-render charts whose file already exists
+        
+    Returns:
+        Tuple of (number of charts generated, list of error messages)
+    """
+    charts_generated = 0
+    errors = []
+    
+    # Joined once per area; chart paths are then plain string formatting
+    path_prefix = os.path.join(output_dir, f'{prefecture}_{area}_')
+    
+    for room_type in room_types:
+        # Combinations without data are not in area_series; skip without rendering or counting
+        if room_type not in area_series:
+            continue
+        
+        try:
+            stats = area_series[room_type]
+            filepaths = {
+                language: f'{path_prefix}{room_type}_{language}.png'
+                for language in ('jp', 'en')
+            }
+            
+            if skip_existing:
+                filepaths = {language: filepath for language, filepath in filepaths.items()
+                             if not os.path.exists(filepath)}
+                if not filepaths:
+                    continue
+            
+            render_charts(filepaths, area, room_type, stats['mean'], stats['count'])
+            charts_generated += len(filepaths)
+            
+        except Exception as e:
+            errors.append(f"Chart generation failed: {prefecture}_{area}_{room_type} - {e}")
+    
+    return charts_generated, errors
+
+def render_area_batch(tasks: list, room_types: list, output_dir: str,
+                      skip_existing: bool = False):
+    """
+    Render a chunk of areas in one worker call
+    
+    Args:
+        tasks: List of (prefecture, area, area_series) tuples
+        room_types: Room types to chart
+        output_dir: Chart output directory
+        skip_existing: If True, don't re-render charts whose file already exists
+        
+    Returns:
+        Tuple of (number of charts generated, list of error messages)
+    """
+    charts_generated = 0
+    errors = []
+    
+    for prefecture, area, area_series in tasks:
+        area_charts, area_errors = render_area_charts(prefecture, area, area_series, room_types,
+                                                      output_dir, skip_existing)
+        charts_generated += area_charts
+        errors.extend(area_errors)
+    
+    return charts_generated, errors
+
+# Fork chart workers on Linux so they inherit the parent's loaded fonts
+# (japanize_matplotlib) and rcParams instead of re-importing them; other
+# platforms keep their default start method
+_chart_mp_context = multiprocessing.get_context('fork') if sys.platform.startswith('linux') else None
+
+# Output directories already created by this process
+_ensured_dirs = set()
+
+def _ensure_dirs(*directories: str):
+    """
+    Create output directories on first use (once per process)
+    
+    Args:
+        directories: Directories to create if missing
+    """
+    for directory in directories:
+        if directory not in _ensured_dirs:
+            os.makedirs(directory, exist_ok=True)
+            _ensured_dirs.add(directory)
+
 class HouseTrendUpdater:
     def __init__(self):
         """Initialize the house trend updater"""
-        self.client = MLITAPIClient()
+        # Output directories
+        self.api_data_dir = "api_data"
+        self.processed_data_dir = "data"
+        self.chart_output_dir = "../../../heysho/frontend/img/trend/house"
+        
+        # Response cache lives with the other API data (opened only when fetching)
+        self.client = MLITAPIClient(cache_path=os.path.join(self.api_data_dir, 'mlit_cache.db'))
         self.transformer = APIDataTransformer()
         
         # Room types for chart generation (matching original system)
         self.room_types = ["ALL", "４ＬＤＫ", "３ＬＤＫ", "２ＬＤＫ", "１ＬＤＫ", "１Ｋ"]
         
-        # Output directories
-        self.api_data_dir = "api_data"
-        self.processed_data_dir = "data"
-        self.chart_output_dir = "../../../heysho/frontend/img/trend/house"
+        # Set True to only render charts missing from chart_output_dir (incremental reruns)
+        self.skip_existing_charts = False
+        
+        # Columns (and dtypes) read back from processed files for charting
+        self.chart_columns = {
+            '市区町村名': 'category',
+            '間取り': self.transformer.categorical_dtypes['間取り'],
+            '取引時期（年）': 'int16',
+            '取引価格（総額）': 'int64',
+            '築年数': 'Int16'
+        }
+        self._processed_data_cache = {}
         
-        # Ensure directories exist
-        os.makedirs(self.api_data_dir, exist_ok=True)
-        os.makedirs(self.processed_data_dir, exist_ok=True)
+        # Memoized yearly chart statistics per prefecture: (df, chart_series)
+        self._chart_series_cache = {}
+        
+        # Worker processes used for chart rendering
+        self.chart_workers = os.cpu_count()
         
         # Progress tracking
         self.progress = {
@@ -72,6 +436,10 @@ class HouseTrendUpdater:
             print(f"\n🔄 STEP 2: Transforming data")
             prefecture_dataframes = self.transform_and_save_data(api_data)
             
+            # Step 2b: Precompute aggregates for lookups
+            print(f"\n🧮 STEP 2b: Precomputing yearly aggregates")
+            self.export_aggregates(prefecture_dataframes)
+            
             # Step 3: Generate charts
             print(f"\n📊 STEP 3: Generating charts")
             self.generate_all_charts(prefecture_dataframes, test_mode)
@@ -89,7 +457,7 @@ class HouseTrendUpdater:
     
     def transform_and_save_data(self, api_data: dict) -> dict:
         """
-        Transform API data and save to CSV files
+        Transform API data and save to Parquet (plus a CSV export)
         
         Args:
             api_data: Dictionary of prefecture data from API
@@ -98,18 +466,27 @@ class HouseTrendUpdater:
             Dictionary of prefecture DataFrames
         """
         prefecture_dataframes = {}
+        _ensure_dirs(self.processed_data_dir)
         
         for prefecture, records in api_data.items():
-            if records:
+            if len(records):
                 print(f"\nProcessing {prefecture}...")
                 
                 # Transform data
                 df = self.transformer.transform_api_data(records)
                 
                 if not df.empty:
-                    # Save to CSV
+                    # Convert once; both files are written by pyarrow's C++ writers
+                    table = pa.Table.from_pandas(df, preserve_index=False)
+                    
+                    # Save to Parquet (typed, compressed, read back by load_processed_data)
+                    parquet_filename = f"{self.processed_data_dir}/{prefecture}_api_processed.parquet"
+                    pq.write_table(table, parquet_filename, compression='zstd')
+                    print(f"💾 Saved {len(df)} records to {parquet_filename}")
+                    
+                    # Save to CSV for human inspection
                     csv_filename = f"{self.processed_data_dir}/{prefecture}_api_processed.csv"
-                    df.to_csv(csv_filename, index=False, encoding='utf-8')
+                    pacsv.write_csv(table, csv_filename)
                     print(f"💾 Saved {len(df)} records to {csv_filename}")
                     
                     prefecture_dataframes[prefecture] = df
@@ -122,13 +499,134 @@ class HouseTrendUpdater:
                 prefecture_dataframes[prefecture] = pd.DataFrame()
             
             self.progress['prefectures_completed'] += 1
+            
+            # Push buffered progress output once per prefecture
+            sys.stdout.flush()
         
         return prefecture_dataframes
     
-    def generate_charts_for_prefecture(self, prefecture: str, df: pd.DataFrame, 
-                                     test_mode: bool = False):
+    def compute_aggregates(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Generate all charts for a single prefecture
+        Compute yearly mean price and transaction count per area
+        
+        Rows cover every (layout, age_bucket) combination including 'ALL'
+        for either dimension, so any filter choice is a single lookup.
+        
+        Args:
+            df: DataFrame with transaction data
+            
+        Returns:
+            DataFrame with columns area, layout, age_bucket, year, mean_price, count
+        """
+        df = df.assign(
+            layout=df['間取り'].astype(str),
+            age_bucket=df['age_bucket'].astype(str),
+            any_layout='ALL',
+            any_age='ALL'
+        )
+        df = df.rename(columns={'市区町村名': 'area', '取引時期（年）': 'year'})
+        
+        # Records with unknown building age only count towards age_bucket 'ALL'
+        known_age = df[df['築年数'].notna()]
+        
+        aggregates = []
+        for data, layout_key, age_key in [(known_age, 'layout', 'age_bucket'),
+                                          (df, 'layout', 'any_age'),
+                                          (known_age, 'any_layout', 'age_bucket'),
+                                          (df, 'any_layout', 'any_age')]:
+            grouped = data.groupby(['area', layout_key, age_key, 'year'], observed=True)['取引価格（総額）']
+            aggregate = grouped.agg(mean_price='mean', count='count').reset_index()
+            aggregates.append(aggregate.set_axis(
+                ['area', 'layout', 'age_bucket', 'year', 'mean_price', 'count'], axis=1
+            ))
+        
+        aggregates = pd.concat(aggregates, ignore_index=True)
+        aggregates['area'] = aggregates['area'].astype(str)
+        return aggregates
+    
+    def export_aggregates(self, prefecture_dataframes: dict):
+        """
+        Save precomputed yearly aggregates for all prefectures to Parquet
+        
+        Args:
+            prefecture_dataframes: Dictionary of prefecture DataFrames
+        """
+        aggregates = [
+            self.compute_aggregates(df).assign(prefecture=prefecture)
+            for prefecture, df in prefecture_dataframes.items()
+            if not df.empty
+        ]
+        
+        if not aggregates:
+            print("⚠️ No data to aggregate")
+            return
+        
+        aggregates = pd.concat(aggregates, ignore_index=True)
+        aggregates = aggregates[['prefecture', 'area', 'layout', 'age_bucket', 'year', 'mean_price', 'count']]
+        
+        _ensure_dirs(self.processed_data_dir)
+        parquet_filename = f"{self.processed_data_dir}/aggregates.parquet"
+        aggregates.to_parquet(parquet_filename, engine='pyarrow', index=False)
+        print(f"💾 Saved {len(aggregates)} aggregate rows to {parquet_filename}")
+    
+    def load_processed_data(self, prefecture: str) -> pd.DataFrame:
+        """
+        Load a prefecture's processed data for chart generation
+        
+        Reads only the chart columns from the Parquet file, falling back to
+        the CSV (parsed with the pyarrow engine) for data processed before
+        Parquet output existed. The file is read once per updater; later
+        calls return the cached DataFrame.
+        
+        Args:
+            prefecture: Prefecture name (english)
+            
+        Returns:
+            DataFrame with the chart columns
+        """
+        if prefecture not in self._processed_data_cache:
+            parquet_filename = f"{self.processed_data_dir}/{prefecture}_api_processed.parquet"
+            csv_filename = f"{self.processed_data_dir}/{prefecture}_api_processed.csv"
+            
+            if os.path.exists(parquet_filename):
+                df = pd.read_parquet(parquet_filename, columns=list(self.chart_columns))
+                df = df.astype(self.chart_columns)
+            else:
+                df = pd.read_csv(
+                    csv_filename,
+                    engine='pyarrow',
+                    usecols=list(self.chart_columns),
+                    dtype=self.chart_columns
+                )
+            
+            self._processed_data_cache[prefecture] = df
+        
+        return self._processed_data_cache[prefecture]
+    
+    def get_chart_series(self, prefecture: str, df: pd.DataFrame) -> dict:
+        """
+        Get yearly statistics for every (area, room type) of a prefecture
+        
+        The groupby runs once per prefecture DataFrame; later calls with the
+        same DataFrame (e.g. successive area batches) are dictionary lookups.
+        
+        Args:
+            prefecture: Prefecture name (english)
+            df: DataFrame with transaction data
+            
+        Returns:
+            Nested dictionary {area: {room_type: DataFrame}} from compute_chart_series
+        """
+        cached = self._chart_series_cache.get(prefecture)
+        if cached is None or cached[0] is not df:
+            cached = (df, compute_chart_series(df, self.room_types))
+            self._chart_series_cache[prefecture] = cached
+        
+        return cached[1]
+    
+    def chart_tasks(self, prefecture: str, df: pd.DataFrame, test_mode: bool = False) -> list:
+        """
+        Build the chart rendering tasks for a single prefecture
         
         Args:
             prefecture: Prefecture name (english)
@@ -136,14 +634,17 @@ class HouseTrendUpdater:
             test_mode: If True, limit chart generation for testing
             
         Returns:
-            Number of charts generated
+            List of (prefecture, area, area_series) tuples, one per area
         """
         if df.empty:
             print(f"  ⚠️ No data for {prefecture}, skipping charts")
-            return 0
+            return []
         
-        areas = df['市区町村名'].unique()
-        charts_generated = 0
+        # Yearly statistics for every (area, room type) in one pass
+        chart_series = self.get_chart_series(prefecture, df)
+        
+        # Areas come from the precomputed keys (no scan of the area column)
+        areas = list(chart_series)
         
         # In test mode, limit to first 3 areas
         if test_mode:
@@ -152,24 +653,83 @@ class HouseTrendUpdater:
         
         print(f"  📊 Generating charts for {len(areas)} areas in {prefecture}")
         
-        for area in areas:
-            for room_type in self.room_types:
-                try:
-                    self.generate_single_chart(
-                        prefecture, area, room_type, df, language='jp'
-                    )
-                    self.generate_single_chart(
-                        prefecture, area, room_type, df, language='en'
-                    )
-                    charts_generated += 2
-                    self.progress['charts_generated'] += 2
-                    
-                except Exception as e:
-                    error_msg = f"Chart generation failed: {prefecture}_{area}_{room_type} - {e}"
-                    self.progress['errors'].append(error_msg)
-                    print(f"    ❌ {error_msg}")
+        return [(prefecture, area, chart_series[area]) for area in areas]
+    
+    def render_chart_tasks(self, tasks: list) -> Tuple[int, List[str]]:
+        """
+        Render chart tasks (from any number of prefectures) in one worker pool
         
-        return charts_generated
+        Workers share no state: each chunk returns its own chart count and
+        error messages, which are summed here as chunks finish.
+        
+        Args:
+            tasks: List of (prefecture, area, area_series) tuples
+            
+        Returns:
+            Tuple of (number of charts generated, list of error messages)
+        """
+        if not tasks:
+            return 0, []
+        
+        charts_generated = 0
+        errors = []
+        
+        # Several areas per dispatch, while leaving ~4 chunks per worker for load balancing
+        chunksize = max(1, len(tasks) // (self.chart_workers * 4))
+        chunks = [tasks[i:i + chunksize] for i in range(0, len(tasks), chunksize)]
+        
+        # Created once here in the parent, never by the workers
+        _ensure_dirs(self.chart_output_dir)
+        
+        # Flush first, so forked workers don't inherit (and re-emit) buffered output
+        sys.stdout.flush()
+        
+        with ProcessPoolExecutor(max_workers=self.chart_workers, mp_context=_chart_mp_context,
+                                 initializer=init_chart_canvas) as executor:
+            futures = [
+                executor.submit(render_area_batch, chunk, self.room_types,
+                                self.chart_output_dir, self.skip_existing_charts)
+                for chunk in chunks
+            ]
+            
+            # Fold results in completion order (a slow chunk doesn't hold back the rest)
+            for future in as_completed(futures):
+                chunk_charts, chunk_errors = future.result()
+                charts_generated += chunk_charts
+                errors.extend(chunk_errors)
+        
+        return charts_generated, errors
+    
+    def record_chart_results(self, charts_generated: int, errors: List[str]):
+        """
+        Add chart results to the pipeline progress and print their errors
+        
+        Args:
+            charts_generated: Number of charts generated
+            errors: Chart error messages
+        """
+        self.progress['charts_generated'] += charts_generated
+        self.progress['errors'].extend(errors)
+        
+        for error_msg in errors:
+            print(f"    ❌ {error_msg}")
+    
+    def generate_charts_for_prefecture(self, prefecture: str, df: pd.DataFrame, 
+                                     test_mode: bool = False) -> Tuple[int, List[str]]:
+        """
+        Generate all charts for a single prefecture
+        
+        Args:
+            prefecture: Prefecture name (english)
+            df: DataFrame with transaction data
+            test_mode: If True, limit chart generation for testing
+            
+        Returns:
+            Tuple of (number of charts generated, list of error messages)
+        """
+        charts_generated, errors = self.render_chart_tasks(self.chart_tasks(prefecture, df, test_mode))
+        self.record_chart_results(charts_generated, errors)
+        return charts_generated, errors
 
     def generate_charts_batch(self, prefecture: str, df: pd.DataFrame,
                              areas_batch: list, batch_id: str = ""):
@@ -193,28 +753,30 @@ class HouseTrendUpdater:
         batch_info = f"batch {batch_id}" if batch_id else f"{len(areas_batch)} areas"
         print(f"  📊 Processing {batch_info} for {prefecture}")
 
+        # Yearly statistics for every (area, room type), computed once per prefecture
+        chart_series = self.get_chart_series(prefecture, df)
+
+        _ensure_dirs(self.chart_output_dir)
+
         for area in areas_batch:
             print(f"    🏠 Generating charts for {area}")
-            for room_type in self.room_types:
-                try:
-                    # Generate both Japanese and English versions
-                    self.generate_single_chart(
-                        prefecture, area, room_type, df, language='jp'
-                    )
-                    self.generate_single_chart(
-                        prefecture, area, room_type, df, language='en'
-                    )
-                    charts_generated += 2
 
-                except Exception as e:
-                    error_msg = f"Chart generation failed: {prefecture}_{area}_{room_type} - {e}"
-                    print(f"    ❌ {error_msg}")
+            # Same per-area rendering as the worker pool, run in this process
+            area_charts, errors = render_area_charts(
+                prefecture, area, chart_series.get(area, {}), self.room_types,
+                self.chart_output_dir, self.skip_existing_charts
+            )
+            charts_generated += area_charts
+
+            for error_msg in errors:
+                print(f"    ❌ {error_msg}")
 
         print(f"  ✅ Batch complete: {charts_generated} charts generated for {prefecture}")
         return charts_generated
 
     def generate_single_chart(self, prefecture: str, area: str, room_type: str,
-                            df: pd.DataFrame, language: str = 'jp'):
+                            yearly_avg_price: pd.Series, yearly_count: pd.Series,
+                            language: str = 'jp'):
         """
         Generate a single chart for specific area and room type
         
@@ -222,87 +784,13 @@ class HouseTrendUpdater:
             prefecture: Prefecture name
             area: Area name  
             room_type: Room type
-            df: DataFrame with data
+            yearly_avg_price: Precomputed average price indexed by year
+            yearly_count: Precomputed transaction count indexed by year
             language: 'jp' or 'en'
         """
-        # Filter data by area and room type
-        if room_type != "ALL":
-            df_filtered = df[(df['市区町村名'] == area) & (df['間取り'] == room_type)]
-        else:
-            df_filtered = df[df['市区町村名'] == area]
-        
-        if len(df_filtered) == 0:
-            return  # Skip if no data
-        
-        # Group by year to calculate average price and count
-        yearly_avg_price = df_filtered.groupby('取引時期（年）')['取引価格（総額）'].mean()
-        yearly_count = df_filtered.groupby('取引時期（年）')['取引価格（総額）'].count()
-        
-        # Create chart
-        plt.figure(figsize=(12, 8))
-        ax1 = plt.gca()
-        
-        # Set legend labels based on language
-        price_label = 'Average Price' if language == 'en' else '平均取引価格'
-        
-        ax1.plot(yearly_avg_price.index, yearly_avg_price.values, 
-                color='red', label=price_label, linewidth=2, marker='o')
-        ax1.set_xlabel('Year' if language == 'en' else 'Year')
-        
-        if language == 'jp':
-            ax1.set_ylabel('平均取引価格', color='darkred')
-            title = f'{area} - {room_type}の平均取引価格と取引件数の推移'
-        else:
-            ax1.set_ylabel('Average Transaction Price', color='darkred')
-            title = f'{area} - The trend of the average transaction price and the number of transactions for {room_type}'
-        
-        ax1.tick_params(axis='y', labelcolor='darkred')
-        ax1.xaxis.set_major_locator(MaxNLocator(integer=True))
-        
-        # Set y-axis limits dynamically based on actual data
-        price_max = max(yearly_avg_price.values) * 1.1  # Add 10% padding
-        count_max = max(yearly_count.values) * 1.2      # Add 20% padding
-        
-        ax1.set_ylim(0, price_max)
-        ax2_ylim = count_max
-        
-        # Format y-axis to show full numbers (no scientific notation)
-        def format_func(value, tick_number):
-            return f'{int(value):,}'
-        
-        ax1.yaxis.set_major_formatter(FuncFormatter(format_func))
-        
-        # Secondary axis for transaction count
-        ax2 = ax1.twinx()
-        
-        # Set transaction count label based on language
-        count_label = 'Transaction Count' if language == 'en' else '取引回数'
-        
-        ax2.bar(yearly_count.index, yearly_count.values, 
-               color='lightblue', label=count_label, width=0.4, alpha=0.5)
-        
-        if language == 'jp':
-            ax2.set_ylabel('取引回数', color='darkblue')
-        else:
-            ax2.set_ylabel('Number of transactions', color='darkblue')
-            
-        ax2.tick_params(axis='y', labelcolor='darkblue')
-        ax2.set_ylim(0, ax2_ylim)
-        
-        plt.title(title, fontsize=14, pad=20)
-        plt.grid(True, alpha=0.3)
-        
-        # Legend
-        lines, labels = ax1.get_legend_handles_labels()
-        lines2, labels2 = ax2.get_legend_handles_labels()
-        ax2.legend(lines + lines2, labels + labels2, loc='upper left')
-        
-        # Save chart
         filename = f'{prefecture}_{area}_{room_type}_{language}.png'
-        filepath = os.path.join(self.chart_output_dir, filename)
-        
-        plt.savefig(filepath, dpi=150, bbox_inches='tight')
-        plt.close()
+        render_chart(os.path.join(self.chart_output_dir, filename), area, room_type,
+                     yearly_avg_price, yearly_count, language)
     
     def generate_all_charts(self, prefecture_dataframes: dict, test_mode: bool = False):
         """
@@ -313,10 +801,17 @@ class HouseTrendUpdater:
             test_mode: If True, limit chart generation for testing
         """
         total_prefectures = len(prefecture_dataframes)
+        tasks = []
         
         for i, (prefecture, df) in enumerate(prefecture_dataframes.items(), 1):
             print(f"\n📊 Charts {i}/{total_prefectures}: {prefecture.upper()}")
-            self.generate_charts_for_prefecture(prefecture, df, test_mode)
+            tasks.extend(self.chart_tasks(prefecture, df, test_mode))
+        
+        # One pool for every prefecture's areas, so workers never idle between prefectures
+        print(f"\n🎨 Rendering charts for {len(tasks)} areas on {self.chart_workers} workers")
+        charts_generated, errors = self.render_chart_tasks(tasks)
+        self.record_chart_results(charts_generated, errors)
+        print(f"✅ Generated {charts_generated} charts")
     
     def generate_completion_report(self):
         """Generate a completion report"""
@@ -334,24 +829,29 @@ class HouseTrendUpdater:
         }
         
         # Save report
-        report_filename = f"api_data/completion_report_{end_time.strftime('%Y%m%d_%H%M%S')}.json"
-        with open(report_filename, 'w', encoding='utf-8') as f:
-            json.dump(report, f, ensure_ascii=False, indent=2)
-        
-        # Print summary
-        print(f"\n📋 COMPLETION REPORT")
-        print(f"Duration: {duration.total_seconds()/60:.1f} minutes")
-        print(f"Total records: {self.progress['total_records']:,}")
-        print(f"Charts generated: {self.progress['charts_generated']:,}")
-        print(f"Errors: {len(self.progress['errors'])}")
-        print(f"Report saved: {report_filename}")
+        _ensure_dirs(self.api_data_dir)
+        report_filename = f"{self.api_data_dir}/completion_report_{end_time.strftime('%Y%m%d_%H%M%S')}.json"
+        with open(report_filename, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        
+        # Print summary (assembled first, written in one call)
+        lines = [
+            f"\n📋 COMPLETION REPORT",
+            f"Duration: {duration.total_seconds()/60:.1f} minutes",
+            f"Total records: {self.progress['total_records']:,}",
+            f"Charts generated: {self.progress['charts_generated']:,}",
+            f"Errors: {len(self.progress['errors'])}",
+            f"Report saved: {report_filename}"
+        ]
         
         if self.progress['errors']:
-            print(f"\n⚠️ ERRORS ENCOUNTERED:")
+            lines.append(f"\n⚠️ ERRORS ENCOUNTERED:")
             for error in self.progress['errors'][:10]:  # Show first 10 errors
-                print(f"  - {error}")
+                lines.append(f"  - {error}")
             if len(self.progress['errors']) > 10:
-                print(f"  ... and {len(self.progress['errors']) - 10} more errors")
+                lines.append(f"  ... and {len(self.progress['errors']) - 10} more errors")
+        
+        sys.stdout.write('\n'.join(lines) + '\n')
 
 if __name__ == "__main__":
     # Run the pipeline